@@ -14,6 +14,7 @@ from collections.abc import AsyncIterator, Iterable
 
 import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from fastflight.core.base import BaseDataService, BaseParams
 
@@ -52,8 +53,10 @@ def create_benchmark_table(total_rows: int, total_cols: int, variant: str = "def
             elif i % 3 == 1:
                 columns.append(pa.array(np.random.normal(0, 1000, size=total_rows).astype(np.float64)))
             else:
-                strings = [f"data_{j}_{np.random.randint(0, 10000)}" for j in range(total_rows)]
-                columns.append(pa.array(strings))
+                # "data_{row}_{random}" built column-wise instead of formatting one Python string per row
+                row_ids = pa.array(np.arange(total_rows)).cast(pa.string())
+                suffixes = pa.array(np.random.randint(0, 10000, size=total_rows)).cast(pa.string())
+                columns.append(pc.binary_join_element_wise("data", row_ids, suffixes, "_"))
     else:
         columns = [pa.array(np.random.randint(0, 50_000, size=total_rows, dtype=np.int32)) for _ in range(total_cols)]
 
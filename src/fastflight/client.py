@@ -162,13 +162,15 @@ class _FlightClientPool:
             self.queue.put_nowait(client)
 
     async def close_async(self):
-        """Close all connections in the pool."""
+        """Close all connections in the pool concurrently."""
+        clients = []
         while not self.queue.empty():
-            client = await self.queue.get()
-            try:
-                await asyncio.to_thread(client.close)
-            except Exception as e:
-                logger.error("Error closing client: %s", e, exc_info=True)
+            clients.append(self.queue.get_nowait())
+        # Each close is a blocking gRPC channel teardown, so fan them out to bound shutdown by the slowest one.
+        results = await asyncio.gather(*(asyncio.to_thread(client.close) for client in clients), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error closing client: %s", result, exc_info=result)
 
 
 R = TypeVar("R")
@@ -386,11 +388,15 @@ class FastFlightBouncer:
             pd.DataFrame: The data from the Flight server as a Pandas DataFrame.
         """
         return await self.aget_stream_reader_with_callback(
-            params, callback=lambda reader: reader.read_all().to_pandas(), resilience_config=resilience_config
+            params,
+            # The intermediate table is never exposed, so its buffers can be released column by column
+            # during conversion instead of holding the Arrow and pandas copies side by side.
+            callback=lambda reader: reader.read_all().to_pandas(self_destruct=True, split_blocks=True),
+            resilience_config=resilience_config,
         )
 
     async def aget_stream(
-        self, params: ParamsData, resilience_config: ResilienceConfig | None = None
+        self, params: ParamsData, resilience_config: ResilienceConfig | None = None, *, compression: str | None = None
     ) -> AsyncIterable[bytes]:
         """
         Bounce a request to generate a stream of Arrow data bytes asynchronously.
@@ -398,14 +404,32 @@ class FastFlightBouncer:
         Args:
             params: Flight request parameters or raw ticket bytes.
             resilience_config: Override default resilience settings for this request.
+            compression: Optional IPC body compression codec ("lz4" or "zstd") for the emitted stream.
 
         Yields:
             bytes: A stream of bytes from the Flight server.
         """
         reader = await self.aget_stream_reader(params, resilience_config=resilience_config)
-        async for chunk in await write_arrow_data_to_stream(reader):
+        async for chunk in await write_arrow_data_to_stream(reader, compression=compression):
             yield chunk
 
+    def get_stream_reader(
+        self, params: ParamsData, resilience_config: ResilienceConfig | None = None
+    ) -> flight.FlightStreamReader:
+        """
+        Synchronously bounce a request to get a Flight stream reader.
+
+        Unlike `get_pa_table`, batches are only pulled from the server as the caller reads them.
+
+        Args:
+            params: Flight request parameters or raw ticket bytes.
+            resilience_config: Override default resilience settings for this request.
+
+        Returns:
+            flight.FlightStreamReader: Stream reader from the Flight server.
+        """
+        return self._converter.run_coroutine(self.aget_stream_reader(params, resilience_config=resilience_config))
+
     def get_pa_table(self, params: ParamsData, resilience_config: ResilienceConfig | None = None) -> pa.Table:
         """
         Synchronously bounce a request to get an Arrow Table.
@@ -2,10 +2,11 @@ import json
 import logging
 from abc import ABC
 from collections.abc import AsyncIterator, Iterable
-from functools import partial
+from functools import cache, partial
 from typing import Any, ClassVar, Generic, TypeVar, get_args, get_origin
 
 import pyarrow as pa
+import pydantic_core
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -110,7 +111,9 @@ class BaseParams(BaseModel, ABC):
     registry: ClassVar[dict[str, ParamsCls]] = {}
 
     @classmethod
+    @cache
     def fqn(cls) -> str:
+        # Cached per class: it is looked up for every ticket serialized on the client and resolved on the server
         return f"{cls.__module__}.{cls.__qualname__}"
 
     @classmethod
@@ -126,10 +129,13 @@ class BaseParams(BaseModel, ABC):
             ParamsCls: The registered DataParams subclass.
 
         Raises:
-            ValueError: If a DataParams subclass with the same fully qualified name is already registered.
+            ValueError: If a different DataParams subclass with the same fully qualified name is already registered.
         """
-        if (fqn := klass.fqn()) in cls.registry:
-            raise ValueError(f"Params type {fqn} is already registered by {cls.registry[fqn]}.")
+        if (ex := cls.registry.get(fqn := klass.fqn())) is klass:
+            # Registering the same class again is a no-op; only a conflicting class is an error
+            return klass
+        if ex is not None:
+            raise ValueError(f"Params type {fqn} is already registered by {ex}.")
         cls.registry[fqn] = klass
         logger.info(f"Registered params type {fqn} for class {klass}")
         return klass
@@ -190,7 +196,15 @@ class BaseParams(BaseModel, ABC):
             raise
 
     def to_bytes(self) -> bytes:
-        return json.dumps(self.to_json()).encode()
+        """
+        Serialize the params to JSON bytes, including the fully qualified name.
+
+        Encoding goes through pydantic-core's native JSON serializer rather than the stdlib `json` module,
+        since every Flight request pays this cost on the client. The output is compact UTF-8 JSON
+        (no spaces after separators, non-ASCII characters not escaped), so the ticket bytes differ from
+        `json.dumps` output for the same params; `from_bytes` accepts both forms.
+        """
+        return pydantic_core.to_json(self.to_json())
 
 
 DataServiceCls = type["BaseDataService"]
@@ -235,7 +249,7 @@ class BaseDataService(Generic[T], ABC):
           - The fully qualified name of the DataParams type.
           - The fully qualified name of the DataService subclass.
         This dual-key registration enforces a one-to-one binding between a DataParams subclass and its
-        corresponding DataService subclass.
+        corresponding DataService subclass. Registering an identical binding again is a no-op.
 
         Args:
             params_cls (type[ParamsCls]): The DataParams subclass that the DataService handles.
@@ -248,11 +262,14 @@ class BaseDataService(Generic[T], ABC):
         if klass is None:
             return partial(cls._register, params_cls)
 
+        param_cls_fqn = params_cls.fqn()
+        if cls._registry.get(param_cls_fqn) is klass and BaseParams.registry.get(param_cls_fqn) is params_cls:
+            return klass
+
         # Register the DataParams class and add the `fqn` attribute to it
         BaseParams._register(params_cls)
 
         # Register the DataService subclass
-        param_cls_fqn = params_cls.fqn()
         if ex := cls._registry.get(param_cls_fqn):
             raise ValueError(f"{param_cls_fqn} is already registered with {ex.fqn()}.")
         cls._registry[param_cls_fqn] = klass
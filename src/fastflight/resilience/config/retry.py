@@ -5,6 +5,7 @@ Provides validation and delay calculation for various retry backoff strategies.
 """
 
 import secrets
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 
@@ -12,6 +13,20 @@ from fastflight.exceptions import FastFlightConnectionError, FastFlightServerErr
 
 from ..types import RetryStrategy
 
+_system_random = secrets.SystemRandom()
+
+
+@lru_cache(maxsize=256)
+def _backoff_delay(strategy: RetryStrategy, base_delay: float, exponential_base: float, attempt: int) -> float:
+    """Deterministic part of the retry delay; cached since a retry loop asks for the same attempts repeatedly."""
+    if strategy == RetryStrategy.FIXED_DELAY:
+        return base_delay
+    elif strategy == RetryStrategy.LINEAR_BACKOFF:
+        return base_delay * attempt
+    elif strategy in (RetryStrategy.EXPONENTIAL_BACKOFF, RetryStrategy.JITTERED_EXPONENTIAL):
+        return base_delay * (exponential_base ** (attempt - 1))
+    return base_delay  # type: ignore[unreachable]
+
 
 class RetryConfig(BaseModel):
     """
@@ -121,18 +136,10 @@ class RetryConfig(BaseModel):
         if attempt <= 0:
             raise ValueError("Retry attempt must be positive")
 
-        if self.strategy == RetryStrategy.FIXED_DELAY:
-            delay = self.base_delay
-        elif self.strategy == RetryStrategy.LINEAR_BACKOFF:
-            delay = self.base_delay * attempt
-        elif self.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
-            delay = self.base_delay * (self.exponential_base ** (attempt - 1))
-        elif self.strategy == RetryStrategy.JITTERED_EXPONENTIAL:
-            base_delay = self.base_delay * (self.exponential_base ** (attempt - 1))
-            jitter = base_delay * self.jitter_factor * (secrets.SystemRandom().random() * 2 - 1)
-            delay = base_delay + jitter
-        else:
-            delay = self.base_delay  # type: ignore[unreachable]
+        delay = _backoff_delay(self.strategy, self.base_delay, self.exponential_base, attempt)
+        if self.strategy == RetryStrategy.JITTERED_EXPONENTIAL:
+            # Only the jitter term is recomputed per call
+            delay += delay * self.jitter_factor * (_system_random.random() * 2 - 1)
 
         return min(delay, self.max_delay)
 
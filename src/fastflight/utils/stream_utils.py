@@ -1,6 +1,7 @@
 import asyncio
 import collections
 import contextlib
+import functools
 import io
 import logging
 import threading
@@ -215,7 +216,15 @@ async def read_record_batches_from_stream(
 _MIN_IPC_CHUNK_SIZE = 64 * 1024  # 64 KiB
 
 
-async def write_arrow_data_to_stream(reader: flight.FlightStreamReader, *, buffer_size=10) -> AsyncIterable[bytes]:
+@functools.cache
+def _ipc_write_options(compression: str | None = None) -> pa.ipc.IpcWriteOptions:
+    """Build the IPC write options for a compression codec once and share them across all stream writers."""
+    return pa.ipc.IpcWriteOptions(compression=compression)
+
+
+async def write_arrow_data_to_stream(
+    reader: flight.FlightStreamReader, *, buffer_size=10, compression: str | None = None
+) -> AsyncIterable[bytes]:
     """
     Convert a FlightStreamReader into an AsyncGenerator of bytes in Arrow IPC format.
 
@@ -223,42 +232,57 @@ async def write_arrow_data_to_stream(reader: flight.FlightStreamReader, *, buffe
     - The producer reads data from the FlightStreamReader by calling its blocking `read_chunk` method.
     - To avoid blocking the event loop, the blocking call is wrapped in `asyncio.to_thread`, which
       runs it in a background thread.
-    - The producer converts each chunk into Arrow IPC formatted bytes and puts them into an async queue.
+    - The producer converts each chunk into Arrow IPC formatted bytes in the same background thread and puts
+      them into an async queue.
     - The consumer asynchronously yields bytes from the queue.
 
     :param reader: A FlightStreamReader instance.
     :param buffer_size: Maximum size of the internal queue. When full, the producer will block.
+    :param compression: Optional IPC body compression codec ("lz4" or "zstd"). Arrow IPC readers decompress
+        transparently, which trades a little CPU for fewer bytes on the wire. Defaults to no compression.
     :return: An AsyncGenerator that yields bytes in Arrow IPC format.
     """
+    # Resolve the options up front so an unknown codec fails the call instead of the background producer.
+    ipc_options = _ipc_write_options(compression)
     # Create an async queue to hold produced byte chunks.
     queue: asyncio.Queue[bytes | Exception | None] = asyncio.Queue(maxsize=buffer_size)
     # Sentinel object to signal the end of the stream.
     end_of_stream = object()
 
     class _ChunkBuffer(io.RawIOBase):
-        """Collects bytes written by the Arrow writer and releases them on demand."""
+        """
+        Collects bytes written by the Arrow writer and releases them on demand.
+
+        Arrow hands over message bodies as `pa.Buffer` views of the batch memory, so writes only keep
+        references and `take` copies everything into one exactly-sized bytes object.
+        """
 
         def __init__(self, min_chunk_size: int) -> None:
-            self._buffer = bytearray()
+            self._chunks: list[bytes | pa.Buffer] = []
+            self._size = 0
             self._closed = False
             self._min_chunk_size = min_chunk_size
 
         def writable(self) -> bool:
             return True
 
-        def write(self, b: bytes | bytearray | memoryview) -> int:  # type: ignore[override]
+        def write(self, b: bytes | bytearray | memoryview | pa.Buffer) -> int:
             if self._closed:
                 raise ValueError("I/O operation on closed buffer")
-            self._buffer.extend(b)
-            return len(b)
+            # Mutable buffers may be reused by the caller, so only those are copied eagerly.
+            self._chunks.append(b if isinstance(b, (bytes, pa.Buffer)) else bytes(b))
+            size = len(b)
+            self._size += size
+            return size
 
         def take(self, *, force: bool = False) -> bytes:
-            if not self._buffer:
+            if not self._size:
                 return b""
-            if not force and len(self._buffer) < self._min_chunk_size:
+            if not force and self._size < self._min_chunk_size:
                 return b""
-            data = bytes(self._buffer)
-            self._buffer.clear()
+            data = b"".join(self._chunks)
+            self._chunks.clear()
+            self._size = 0
             return data
 
         def close(self) -> None:
@@ -282,8 +306,8 @@ async def write_arrow_data_to_stream(reader: flight.FlightStreamReader, *, buffe
         Producer coroutine that continuously retrieves data chunks from the reader,
         converts them into Arrow IPC formatted bytes, and puts them into the queue.
 
-        The blocking call to read_chunk is executed in a background thread using asyncio.to_thread
-        to ensure the event loop remains responsive.
+        The blocking call to read_chunk and the IPC encoding of each chunk are executed together in a
+        background thread using asyncio.to_thread to ensure the event loop remains responsive.
         """
         chunk_buffer = _ChunkBuffer(_MIN_IPC_CHUNK_SIZE)
         arrow_sink = pa.output_stream(chunk_buffer)  # type: ignore[arg-type]
@@ -294,38 +318,57 @@ async def write_arrow_data_to_stream(reader: flight.FlightStreamReader, *, buffe
             if data:
                 await queue.put(data)
 
+        def encode_next_chunk() -> bool:
+            """
+            Read the next chunk and encode it into the chunk buffer. Returns False at the end of the stream.
+
+            Reading and IPC encoding share one worker thread hop: Arrow releases the GIL for both, so
+            serializing (and compressing) large batches does not stall the event loop.
+            """
+            nonlocal writer
+            chunk = next_chunk()
+            if chunk is end_of_stream:
+                return False
+
+            if chunk.data is None:
+                logger.warning("Chunk data is None. Ignored and continue")
+                return True
+
+            if writer is None:
+                writer = pa.ipc.new_stream(arrow_sink, chunk.data.schema, options=ipc_options)
+
+            writer.write_batch(chunk.data)
+            return True
+
         has_error = False
+        in_flight: asyncio.Future[bool] | None = None
         try:
             logger.debug("Start producing Arrow IPC bytes from FlightStreamReader %s", id(reader))
             schema = getattr(reader, "schema", None)
             if schema is not None and not isinstance(schema, pa.Schema):
                 schema = None
             if schema is not None:
-                writer = pa.ipc.new_stream(arrow_sink, schema)
+                writer = pa.ipc.new_stream(arrow_sink, schema, options=ipc_options)
                 await flush_buffer(force=True)
 
             while True:
-                # Wrap the blocking next_chunk() call in asyncio.to_thread to run it without blocking the event loop.
-                chunk = await asyncio.to_thread(next_chunk)
-                if chunk is end_of_stream:
-                    # If the sentinel is received, break the loop.
+                # Shielded so that cancelling the producer never abandons a worker that is still using the writer
+                in_flight = asyncio.ensure_future(asyncio.to_thread(encode_next_chunk))
+                if not await asyncio.shield(in_flight):
                     break
-
-                if chunk.data is None:
-                    logger.warning("Chunk data is None. Ignored and continue")
-                    continue
-
-                if writer is None:
-                    writer = pa.ipc.new_stream(arrow_sink, chunk.data.schema)
-                    await flush_buffer(force=True)
-
-                writer.write_batch(chunk.data)
                 await flush_buffer()
         except Exception as e:
             has_error = True
             logger.error("Error during producing Arrow IPC bytes", exc_info=True)
             await queue.put(e)
         finally:
+            if in_flight is not None and not in_flight.done():
+                # Wait for the worker to finish with the writer (it may even create one) before closing it here.
+                await asyncio.wait({in_flight})
+                if not in_flight.cancelled() and in_flight.exception() is not None:
+                    logger.debug(
+                        "Arrow IPC encoding failed after the producer was cancelled", exc_info=in_flight.exception()
+                    )
             try:
                 if writer is not None:
                     writer.close()
@@ -463,7 +506,7 @@ def read_table_from_arrow_stream(stream: Iterable[bytes]) -> pa.Table:
 
 def read_dataframe_from_arrow_stream(stream: Iterable[bytes]) -> pd.DataFrame:
     table = read_table_from_arrow_stream(stream)
-    return table.to_pandas()
+    return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 _thread_local = threading.local()
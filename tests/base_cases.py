@@ -1,8 +1,8 @@
+import socket
 import threading
 import time
 import unittest
 
-import pandas as pd
 import pyarrow as pa
 from pyarrow import flight as flight
 
@@ -40,9 +40,54 @@ class SimpleFlightServer(flight.FlightServerBase):
         return flight.RecordBatchStream(table)
 
 
+HOST, PORT = "127.0.0.1", 18181
+LOCATION = f"grpc://{HOST}:{PORT}"
+# Default data served for every ticket; Arrow tables are immutable, so one instance is shared by all test cases.
+DEFAULT_TABLE = pa.table({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+
+# The Flight server is shared by every FlightServerTestCase subclass; it is started on first use
+# and shut down once at the end of the session (see tests/conftest.py).
+_shared_server: tuple[SimpleFlightServer, threading.Thread] | None = None
+
+
+def wait_for_port(host: str, port: int, timeout: float = 2.0, interval: float = 0.01) -> None:
+    """Poll until a TCP connection to (host, port) succeeds instead of sleeping for a fixed interval."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.05).close()
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Nothing is listening on {host}:{port} after {timeout} seconds") from None
+            time.sleep(interval)
+
+
+def get_shared_server() -> SimpleFlightServer:
+    """Return the shared Flight server, starting it and waiting for its port on first use."""
+    global _shared_server
+    if _shared_server is None:
+        server = SimpleFlightServer(LOCATION, {})
+        server_thread = threading.Thread(target=server.serve, daemon=True)
+        server_thread.start()
+        wait_for_port(HOST, PORT)
+        _shared_server = server, server_thread
+    return _shared_server[0]
+
+
+def shutdown_shared_server() -> None:
+    """Shut down the shared Flight server if it was started."""
+    global _shared_server
+    if _shared_server is not None:
+        server, server_thread = _shared_server
+        _shared_server = None
+        server.shutdown()
+        server_thread.join(timeout=2)
+
+
 class FlightServerTestCase(unittest.IsolatedAsyncioTestCase):
     """
-    Shared test case class that starts a Flight server before all tests and shuts it down after all tests.
+    Shared test case class that connects to the shared Flight server before all tests.
     Child classes can override or modify the server configuration (data map or error simulation) per test.
     """
 
@@ -51,20 +96,14 @@ class FlightServerTestCase(unittest.IsolatedAsyncioTestCase):
     @classmethod
     def setUpClass(cls):
         cls.initial_data = cls.get_server_data()
-        cls.location = "grpc://127.0.0.1:18181"
-        # Initialize the Flight server with default data.
-        cls.server = SimpleFlightServer(cls.location, cls.initial_data)
-        cls.server_thread = threading.Thread(target=cls.server.serve, daemon=True)
-        cls.server_thread.start()
-        # Allow some time for the server to start.
-        time.sleep(1)
+        cls.location = LOCATION
+        cls.server = get_shared_server()
+        cls.server.set_data_map(cls.initial_data)
         cls.client = flight.FlightClient(cls.location)
 
     @classmethod
     def tearDownClass(cls):
         cls.client.close()
-        cls.server.shutdown()
-        cls.server_thread.join(timeout=2)
 
     def setUp(self):
         # Reset the server configuration for each test.
@@ -73,10 +112,7 @@ class FlightServerTestCase(unittest.IsolatedAsyncioTestCase):
 
     @classmethod
     def get_server_data(cls) -> dict:
-        # By default, create a simple DataFrame and convert it to an Arrow Table.
-        df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
-        table = pa.Table.from_pandas(df)
-        return {b"dummy": table}
+        return {b"dummy": DEFAULT_TABLE}
 
     @classmethod
     def get_stream_reader(cls, ticket: bytes) -> flight.FlightStreamReader:
@@ -0,0 +1,10 @@
+import pytest
+
+from tests.base_cases import shutdown_shared_server
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_flight_server():
+    """Shut down the Flight server shared by FlightServerTestCase subclasses once all tests have run."""
+    yield
+    shutdown_shared_server()
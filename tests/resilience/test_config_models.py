@@ -23,18 +23,16 @@ class TestRetryConfig:
         assert config.max_delay == 10.0
 
     def test_negative_max_attempts_rejected(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="greater than or equal to 1"):
             RetryConfig(max_attempts=-1)
-        assert "greater than or equal to 1" in str(exc_info.value)
 
     def test_negative_base_delay_rejected(self):
         with pytest.raises(ValidationError):
             RetryConfig(base_delay=-1.0)
 
     def test_max_delay_less_than_base_delay_rejected(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="max_delay"):
             RetryConfig(base_delay=10.0, max_delay=5.0)
-        assert "max_delay" in str(exc_info.value)
 
     def test_computed_field_calculation(self):
         config = RetryConfig(max_attempts=3, strategy=RetryStrategy.FIXED_DELAY, base_delay=2.0)
@@ -51,9 +49,8 @@ class TestCircuitBreakerConfig:
         assert config.recovery_timeout == 30.0
 
     def test_zero_failure_threshold_rejected(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="greater than or equal to 1"):
             CircuitBreakerConfig(failure_threshold=0)
-        assert "greater than or equal to 1" in str(exc_info.value)
 
     def test_negative_recovery_timeout_rejected(self):
         with pytest.raises(ValidationError):
@@ -83,11 +80,10 @@ class TestResilienceConfig:
         assert config.circuit_breaker_config.failure_threshold == 3
 
     def test_invalid_circuit_breaker_name_pattern(self):
-        with pytest.raises(ValidationError) as exc_info:
+        with pytest.raises(ValidationError, match="String should match pattern"):
             ResilienceConfig(
                 circuit_breaker_name="invalid name with spaces!", circuit_breaker_config=CircuitBreakerConfig()
             )
-        assert "String should match pattern" in str(exc_info.value)
 
     def test_method_chaining(self):
         base_config = ResilienceConfig.create_default()
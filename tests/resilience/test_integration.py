@@ -2,6 +2,7 @@
 Integration tests for resilience patterns working together.
 """
 
+import asyncio
 import os
 import sys
 
@@ -21,8 +22,20 @@ class TestResilienceIntegration:
     def manager(self):
         return ResilienceManager()
 
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record retry backoff delays instead of waiting them out."""
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float, result=None):
+            delays.append(delay)
+            return result
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        return delays
+
     @pytest.mark.asyncio
-    async def test_retry_only_configuration(self, manager):
+    async def test_retry_only_configuration(self, manager, sleeps):
         call_count = 0
 
         async def flaky_func():
@@ -39,6 +52,7 @@ class TestResilienceIntegration:
         result = await manager.execute_with_resilience(flaky_func, config=config)
         assert result == "success_after_3_attempts"
         assert call_count == 3
+        assert len(sleeps) == 2
 
     @pytest.mark.asyncio
     async def test_circuit_breaker_only_configuration(self, manager):
@@ -61,7 +75,7 @@ class TestResilienceIntegration:
             await manager.execute_with_resilience(failing_func, config=config)
 
     @pytest.mark.asyncio
-    async def test_combined_retry_and_circuit_breaker(self, manager):
+    async def test_combined_retry_and_circuit_breaker(self, manager, sleeps):
         config = ResilienceConfig(
             retry_config=RetryConfig(max_attempts=2, base_delay=0.01),
             circuit_breaker_config=CircuitBreakerConfig(failure_threshold=3),
@@ -81,6 +95,7 @@ class TestResilienceIntegration:
             await manager.execute_with_resilience(always_failing_func, config=config)
 
         assert call_count == 2  # Retried once
+        assert len(sleeps) == 1
 
     def test_config_factory_methods_work_together(self, manager):
         # Test different factory configurations
@@ -50,6 +50,14 @@ class TestRetryDelayCalculation:
         assert config.calculate_delay(2) == 2.0  # 1.0 * 2
         assert config.calculate_delay(3) == 3.0  # 1.0 * 3
 
+    def test_jittered_exponential_strategy(self):
+        config = RetryConfig(
+            strategy=RetryStrategy.JITTERED_EXPONENTIAL, base_delay=1.0, exponential_base=2.0, jitter_factor=0.5
+        )
+        for attempt, expected in [(1, 1.0), (2, 2.0), (3, 4.0)]:
+            for _ in range(5):
+                assert expected * 0.5 <= config.calculate_delay(attempt) <= expected * 1.5
+
     def test_delay_respects_max_delay(self):
         config = RetryConfig(
             strategy=RetryStrategy.EXPONENTIAL_BACKOFF, base_delay=1.0, max_delay=5.0, exponential_base=2.0
@@ -9,6 +9,18 @@ from pyarrow import RecordBatch
 from fastflight.core.base import BaseDataService, BaseParams
 
 
+@pytest.fixture(autouse=True)
+def registry_snapshot():
+    """Restore the global registries after each test so classes defined inside a test do not leak."""
+    params_registry = BaseParams.registry.copy()
+    service_registry = BaseDataService._registry.copy()
+    yield
+    BaseParams.registry.clear()
+    BaseParams.registry.update(params_registry)
+    BaseDataService._registry.clear()
+    BaseDataService._registry.update(service_registry)
+
+
 # Sample Params class
 class SampleParams(BaseParams):
     some_field: str
@@ -29,7 +41,7 @@ def test_sampledataservice_get_batches():
     assert len(batches) == 1
     assert isinstance(batches[0], pa.RecordBatch)
     assert batches[0].num_columns == 1
-    assert batches[0].column(0).to_pylist() == [1, 2, 3]
+    assert batches[0].column(0).equals(pa.array([1, 2, 3]))
 
 
 # Sample Params class
@@ -58,22 +70,40 @@ async def test_sampledataservice_aget_batches():
     assert len(batches) == 1
     assert isinstance(batches[0], pa.RecordBatch)
     assert batches[0].num_columns == 1
-    assert batches[0].column(0).to_pylist() == [1, 2, 3]
+    assert batches[0].column(0).equals(pa.array([1, 2, 3]))
 
 
-# Test duplicate param registration raises
-def test_duplicate_param_registration_raises() -> None:
+# Test re-registering the same binding is a no-op
+def test_reregister_same_service_is_noop() -> None:
     class MyParams(BaseParams):
         foo: str
 
-    # Register once (should succeed)
+    # Registered automatically on class creation
     class MyService(BaseDataService[MyParams]):
         def get_batches(self, params: MyParams, batch_size: int | None = None) -> Iterable[RecordBatch]:
             yield pa.RecordBatch.from_arrays([pa.array([1])], ["col"])
 
-    # Register again (should raise ValueError)
+    assert BaseDataService._register(MyParams, MyService) is MyService
+    assert BaseDataService.lookup(MyParams.fqn()) is MyService
+
+
+# Test duplicate param registration raises
+def test_duplicate_param_registration_raises() -> None:
+    class MyParams1(BaseParams):
+        foo: str
+
+    BaseParams._register(MyParams1)
+    # A different class created with the same fully qualified name from the start
+    OtherParams1 = type(
+        "MyParams1",
+        (BaseParams,),
+        {"__module__": MyParams1.__module__, "__qualname__": MyParams1.__qualname__, "__annotations__": {"foo": str}},
+    )
+    assert OtherParams1 is not MyParams1
+    assert OtherParams1.fqn() == MyParams1.fqn()
+
     with pytest.raises(ValueError):
-        BaseDataService._register(MyParams, MyService)
+        BaseParams._register(OtherParams1)
 
 
 # Test duplicate service registration raises
@@ -85,9 +115,24 @@ def test_duplicate_service_registration_raises() -> None:
         def get_batches(self, params: MyParams2, batch_size: int | None = None) -> Iterable[RecordBatch]:
             yield pa.RecordBatch.from_arrays([pa.array([1])], ["col"])
 
-    # Try to register again for the same param class
+    class OtherService2(BaseDataService):
+        def get_batches(self, params: MyParams2, batch_size: int | None = None) -> Iterable[RecordBatch]:
+            yield pa.RecordBatch.from_arrays([pa.array([2])], ["col"])
+
+    # Try to bind a different service to the same param class
     with pytest.raises(ValueError):
-        BaseDataService._register(MyParams2, MyService2)
+        BaseDataService._register(MyParams2, OtherService2)
+
+
+def test_params_bytes_round_trip_is_stable():
+    params = SampleParams(some_field="test")
+
+    data = params.to_bytes()
+    restored = BaseParams.from_bytes(data)
+
+    assert restored == params
+    assert restored.to_bytes() == data
+    assert json.loads(data) == {"some_field": "test", "param_type": SampleParams.fqn()}
 
 
 # Test from_bytes unknown param class raises
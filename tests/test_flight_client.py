@@ -1,6 +1,8 @@
 import unittest
+from unittest.mock import MagicMock
 
 import pyarrow as pa
+from pyarrow import flight
 
 from fastflight import FastFlightError
 from fastflight.client import FastFlightBouncer
@@ -32,6 +34,14 @@ class TestFlightClient(FlightServerTestCase):
             received_table = ipc_reader.read_all()
             self.assertTrue(received_table.equals(self.get_server_data()[b"dummy"]))
 
+    def test_get_stream_reader_reads_first_batch(self):
+        with FastFlightBouncer(self.location) as bouncer:
+            reader = bouncer.get_stream_reader(b"dummy")
+            first = reader.read_chunk().data
+
+            assert reader.schema.names == ["col1", "col2"]
+            assert first.num_rows == 3
+
     async def test_connection_returned_on_failure(self):
         bouncer = FastFlightBouncer(self.location, client_pool_size=1)
 
@@ -43,6 +53,25 @@ class TestFlightClient(FlightServerTestCase):
 
         assert bouncer._connection_pool.queue.qsize() == 1
 
+    async def test_close_async_drains_pool(self):
+        bouncer = FastFlightBouncer(self.location, client_pool_size=3)
+        pool = bouncer._connection_pool
+        # Swap the real pooled clients for mocks, one of which fails to close
+        clients = [MagicMock(spec=flight.FlightClient) for _ in range(3)]
+        clients[1].close.side_effect = RuntimeError("close failed")
+        while not pool.queue.empty():
+            pool.queue.get_nowait().close()
+        for client in clients:
+            pool.queue.put_nowait(client)
+
+        with self.assertLogs("fastflight.client", level="ERROR") as logs:
+            await bouncer.close_async()
+
+        assert pool.queue.empty()
+        for client in clients:
+            client.close.assert_called_once_with()
+        assert any("close failed" in message for message in logs.output)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,11 @@
 import asyncio
 import unittest
+from collections.abc import Iterator
 from types import SimpleNamespace
 
 import pandas as pd
 import pyarrow as pa
+import pytest
 
 from fastflight.utils.stream_utils import (
     read_dataframe_from_arrow_stream,
@@ -11,57 +13,48 @@ from fastflight.utils.stream_utils import (
     write_arrow_data_to_stream,
 )
 
+TEST_TABLE = pa.table({"id": [1, 2, 3], "name": ["one", "two", "three"]})
 
-class TestTableFunctions(unittest.TestCase):
-    """Test cases for Arrow table reading functions."""
 
-    def test_read_table_from_arrow_stream(self):
-        """Test reading a table from an iterable of bytes."""
-        # Create Arrow table data
-        data = pd.DataFrame({"id": [1, 2, 3], "name": ["one", "two", "three"]})
-        table = pa.Table.from_pandas(data)
-
-        # Write table to IPC format
-        sink = pa.BufferOutputStream()
-        writer = pa.ipc.RecordBatchStreamWriter(sink, table.schema)
-        writer.write_table(table)
-        writer.close()
-        buf = sink.getvalue()
-
-        # Split buffer into chunks
-        chunks = [buf.to_pybytes()[i : i + 10] for i in range(0, len(buf.to_pybytes()), 10)]
-
-        # Test read_table_from_arrow_stream
-        result_table = read_table_from_arrow_stream(chunks)
-
-        # Verify result
-        self.assertEqual(result_table.num_rows, 3)
-        self.assertEqual(result_table.num_columns, 2)
-        self.assertEqual(result_table.column_names, ["id", "name"])
-
-    def test_read_dataframe_from_arrow_stream(self):
-        """Test reading a DataFrame from an iterable of bytes."""
-        # Create Arrow table data
-        data = pd.DataFrame({"id": [1, 2, 3], "name": ["one", "two", "three"]})
-        table = pa.Table.from_pandas(data)
-
-        # Write table to IPC format
-        sink = pa.BufferOutputStream()
-        writer = pa.ipc.RecordBatchStreamWriter(sink, table.schema)
-        writer.write_table(table)
-        writer.close()
-        buf = sink.getvalue()
-
-        # Split buffer into chunks
-        chunks = [buf.to_pybytes()[i : i + 10] for i in range(0, len(buf.to_pybytes()), 10)]
-
-        # Test read_dataframe_from_arrow_stream
-        result_df = read_dataframe_from_arrow_stream(chunks)
+@pytest.fixture(scope="module")
+def ipc_bytes() -> bytes:
+    """IPC stream bytes for TEST_TABLE, serialized once and shared by the stream-reader tests."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, TEST_TABLE.schema) as writer:
+        writer.write_table(TEST_TABLE)
+    return sink.getvalue().to_pybytes()
+
+
+def _chunk(raw: bytes, n: int = 10) -> Iterator[bytes]:
+    """Yield fixed-size slices of raw lazily, as a network stream would deliver them."""
+    mv = memoryview(raw)
+    for i in range(0, len(mv), n):
+        yield bytes(mv[i : i + n])
+
+
+def _assert_table(result: pa.Table) -> None:
+    assert result.equals(TEST_TABLE)
+
 
-        # Verify result
-        self.assertEqual(len(result_df), 3)
-        self.assertEqual(list(result_df.columns), ["id", "name"])
-        pd.testing.assert_frame_equal(result_df, data)
+def _assert_dataframe(result: pd.DataFrame) -> None:
+    assert list(result.columns) == ["id", "name"]
+    assert result["id"].dtype == "int64"
+    assert pd.api.types.is_string_dtype(result["name"])
+    assert result.to_dict("list") == TEST_TABLE.to_pydict()
+
+
+@pytest.mark.parametrize(
+    "read_stream, check",
+    [(read_table_from_arrow_stream, _assert_table), (read_dataframe_from_arrow_stream, _assert_dataframe)],
+    ids=["table", "dataframe"],
+)
+def test_read_from_arrow_stream(read_stream, check, ipc_bytes):
+    """Test reading a table or DataFrame from an iterable of bytes."""
+    check(read_stream(_chunk(ipc_bytes)))
+
+
+class TestTableFunctions(unittest.TestCase):
+    """Test cases for Arrow table reading functions."""
 
     def test_write_arrow_stream_multiple_batches(self):
         """Ensure write_arrow_data_to_stream produces a continuous Arrow stream."""
@@ -90,9 +83,7 @@ class TestTableFunctions(unittest.TestCase):
         result_df = read_dataframe_from_arrow_stream(chunks)
 
         self.assertEqual(len(result_df), 6)
-        pd.testing.assert_series_equal(
-            result_df["value"], pd.Series([1, 2, 3, 4, 5, 6], name="value"), check_names=True
-        )
+        self.assertEqual(result_df.to_dict("list"), {"value": [1, 2, 3, 4, 5, 6]})
 
 
 if __name__ == "__main__":
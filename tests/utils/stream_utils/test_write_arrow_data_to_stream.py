@@ -1,5 +1,7 @@
 import asyncio
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -62,6 +64,56 @@ class TestWriteArrowDataToStream(unittest.TestCase):
         finally:
             loop.close()
 
+    def test_write_arrow_data_to_stream_with_compression(self):
+        """Test that compressed IPC output is smaller and still reads back to the same table."""
+        record_batch = pa.RecordBatch.from_arrays([pa.array([7] * 10_000)], ["value"])
+
+        async def collect(compression):
+            mock_reader = MagicMock(spec=flight.FlightStreamReader)
+            chunk_mock = MagicMock()
+            chunk_mock.data = record_batch
+            mock_reader.read_chunk.side_effect = [chunk_mock, StopIteration]
+            stream = await write_arrow_data_to_stream(mock_reader, compression=compression)
+            return b"".join([data async for data in stream])
+
+        plain = asyncio.run(collect(None))
+        compressed = asyncio.run(collect("zstd"))
+
+        self.assertLess(len(compressed), len(plain))
+        table = pa.ipc.open_stream(pa.BufferReader(compressed)).read_all()
+        self.assertTrue(table.equals(pa.Table.from_batches([record_batch])))
+
+    def test_cancelled_producer_closes_writer_after_in_flight_chunk(self):
+        """Cancelling the producer mid-read must let the worker finish before the writer is closed."""
+        record_batch = pa.RecordBatch.from_arrays([pa.array([1, 2, 3])], ["value"])
+        reading = threading.Event()
+        release = threading.Event()
+
+        def read_chunk():
+            if reading.is_set():
+                raise StopIteration
+            reading.set()
+            release.wait(timeout=5)
+            return SimpleNamespace(data=record_batch, app_metadata=None)
+
+        mock_reader = MagicMock(spec=flight.FlightStreamReader)
+        mock_reader.read_chunk.side_effect = read_chunk
+
+        async def test():
+            stream = await write_arrow_data_to_stream(mock_reader)
+            await asyncio.to_thread(reading.wait, 5)
+            (producer,) = [task for task in asyncio.all_tasks() if task.get_coro().__name__ == "produce"]
+            producer.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return b"".join([data async for data in stream])
+
+        data = asyncio.run(test())
+
+        # The batch encoded after the cancellation is followed by a proper end-of-stream marker.
+        table = pa.ipc.open_stream(pa.BufferReader(data)).read_all()
+        self.assertTrue(table.equals(pa.Table.from_batches([record_batch])))
+
     @patch("asyncio.to_thread")
     def test_write_arrow_data_error_handling(self, mock_to_thread):
         """Test error handling in write_arrow_data_to_stream."""